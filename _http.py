@@ -0,0 +1,95 @@
+"""Shared HTTP session for the API tests and scripts
+
+One keep-alive connection pool is reused for every request a run makes,
+so only the first request to the server pays for the TCP connect.
+"""
+import os
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # orjson parses the analysis responses several times faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Streams multipart bodies from disk instead of building them in memory
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+# (connect, read) seconds: an unreachable server fails fast, while a slow
+# analysis still gets the full read budget
+DEFAULT_TIMEOUT = (2.0, 30.0)
+HEALTH_TIMEOUT = (0.5, 2.0)
+
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        # Retry only failed connects briefly; analysis errors are reported as-is
+        max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1),
+    ),
+)
+
+
+def parse(response: requests.Response):
+    """Decode a JSON response body, with orjson when it is installed"""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def wait_ready(url: str = "http://127.0.0.1:8000/", deadline: float = 10.0) -> bool:
+    """
+    Poll the server until it answers, instead of sleeping a fixed time
+
+    The successful probe also leaves a warm connection in SESSION's pool for
+    the request that follows.
+
+    Args:
+        url: URL to probe with GET
+        deadline: Seconds to keep trying before giving up
+
+    Returns:
+        True once the server responded with 200, False if the deadline passed
+    """
+    give_up = time.monotonic() + deadline
+    while time.monotonic() < give_up:
+        try:
+            if SESSION.get(url, timeout=0.25).status_code == 200:
+                return True
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            pass
+        time.sleep(0.1)
+    return False
+
+
+def post_file(url: str, fields: dict, file_field: str, path: str, **kwargs) -> requests.Response:
+    """
+    POST a form with one file upload through SESSION
+
+    With requests-toolbelt installed, the file is streamed from disk into the
+    socket in chunks, so peak memory stays at one chunk rather than the whole
+    file; the body length is still known up front and sent as Content-Length.
+    Without it, requests builds the multipart body in memory.
+
+    Args:
+        url: URL to POST to
+        fields: Plain form fields
+        file_field: Form field name for the file
+        path: Path of the file to upload
+        **kwargs: Passed on to SESSION.post (e.g. timeout)
+    """
+    name = os.path.basename(path)
+    with open(path, "rb") as f:
+        if MultipartEncoder is None:
+            return SESSION.post(url, data=fields, files={file_field: (name, f)}, **kwargs)
+        body = MultipartEncoder(fields={**fields, file_field: (name, f)})
+        return SESSION.post(url, data=body, headers={"Content-Type": body.content_type}, **kwargs)
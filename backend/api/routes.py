@@ -1,30 +1,146 @@
 """API Routes for Resume ATS Checker"""
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from typing import Optional
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from typing import BinaryIO, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import base64
+import binascii
+import hashlib
 import io
+import logging
+import os
+import threading
 
-from models.schemas import ATSAnalysisResponse, AnalyzeRequest
+import orjson
+
+from models.schemas import (
+    ATSAnalysisResponse,
+    AnalyzeBatchRequest,
+    AnalyzeBatchResponse,
+    AnalyzeRequest,
+    BatchAnalyzeItem,
+)
 from services.resume_analyzer import ResumeAnalyzer
 
+logger = logging.getLogger("resume_ats")
+
 router = APIRouter()
 _analyzer = None  # Lazy-loaded
+_analyzer_lock = threading.Lock()
+_models_loaded = False  # Set once warmup_analyzer() has finished
+
+# Upload file extension -> parser file type
+_EXTENSION_TO_FILE_TYPE = {
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.doc': 'docx',
+    '.txt': 'text',
+}
+
+# Largest resume file accepted, in bytes
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+
+# Most resume/job description pairs accepted in one batch request
+MAX_BATCH_ITEMS = int(os.environ.get("MAX_BATCH_ITEMS", "16"))
+
+# Parsed resume text keyed by (BLAKE2b of upload, file type), so resubmitting
+# the same file skips PDF/DOCX extraction entirely
+RESUME_CACHE_SIZE = int(os.environ.get("RESUME_CACHE_SIZE", "128"))
+_parsed_resume_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_parsed_resume_cache_lock = threading.Lock()
+
+# Blocking PDF/DOCX extraction and NLP analysis run here so concurrent
+# requests are processed in parallel instead of stalling the event loop.
+# PDFium itself is not thread-safe; PDFParser serializes every pdfium call
+# behind its own lock, so only DOCX/pdfplumber parsing and analysis overlap.
+ANALYSIS_WORKERS = int(os.environ.get("ANALYSIS_WORKERS", str(os.cpu_count() or 1)))
+_executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix="resume-analysis")
+
+# Static health payloads, serialized once at import for cheap liveness probes
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "Resume ATS Checker", "models_loaded": True})
+_HEALTH_WARMING_BYTES = orjson.dumps({"status": "healthy", "service": "Resume ATS Checker", "models_loaded": False})
 
 
 def get_analyzer():
     """Get or create the analyzer instance (lazy loading)"""
     global _analyzer
     if _analyzer is None:
-        print("Initializing ResumeAnalyzer...")
-        _analyzer = ResumeAnalyzer()
-        print("ResumeAnalyzer initialized successfully")
+        # Warmup runs in the background, so a request may race it here
+        with _analyzer_lock:
+            if _analyzer is None:
+                logger.info("Initializing ResumeAnalyzer...")
+                _analyzer = ResumeAnalyzer()
+                logger.info("ResumeAnalyzer initialized successfully")
     return _analyzer
 
 
+def warmup_analyzer():
+    """Load the analyzer and its NLP models, then report them loaded on /health"""
+    global _models_loaded
+    try:
+        get_analyzer().warmup()
+    except Exception as e:
+        # Requests still load whatever they need on first use
+        logger.exception("Model warmup failed: %s", e)
+        return
+    _models_loaded = True
+    logger.info("Models loaded")
+
+
+async def _run_blocking(func, *args):
+    """Run a blocking call on the bounded analysis pool and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, func, *args)
+
+
+def _hash_upload(file_obj: BinaryIO) -> bytes:
+    """16-byte BLAKE2b digest of an uploaded file, read in chunks and rewound"""
+    digest = hashlib.blake2b(digest_size=16)
+    file_obj.seek(0)
+    for chunk in iter(lambda: file_obj.read(64 * 1024), b""):
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.digest()
+
+
+def _parse_cached(file_obj: BinaryIO, file_type: str) -> str:
+    """Parse an uploaded resume, reusing the text of identical earlier uploads"""
+    key = (_hash_upload(file_obj), file_type)
+    with _parsed_resume_cache_lock:
+        cached = _parsed_resume_cache.get(key)
+        if cached is not None:
+            _parsed_resume_cache.move_to_end(key)
+            return cached
+    
+    parsed = get_analyzer().parse_resume(file_obj, file_type)
+    
+    with _parsed_resume_cache_lock:
+        _parsed_resume_cache[key] = parsed
+        while len(_parsed_resume_cache) > RESUME_CACHE_SIZE:
+            _parsed_resume_cache.popitem(last=False)
+    return parsed
+
+
+def _analysis_response(analysis_result: dict, verbose: bool):
+    """Return the compact or full analysis for an endpoint's response
+
+    Plain dicts go through response_model, which keeps only the
+    ATSAnalysisResponse fields. A Response is sent as-is, so verbose
+    requests get the analyzer's full output.
+    """
+    if verbose:
+        return ORJSONResponse(analysis_result)
+    return analysis_result
+
+
 @router.post("/analyze", response_model=ATSAnalysisResponse)
 async def analyze_resume(
     job_description: str = Form(..., min_length=10),
     resume_file: Optional[UploadFile] = File(None),
-    resume_text: Optional[str] = Form(None)
+    resume_text: Optional[str] = Form(None),
+    verbose: bool = False
 ):
     """
     Analyze resume against job description
@@ -37,6 +153,9 @@ async def analyze_resume(
         job_description: Job description text (required)
         resume_file: Resume file upload (PDF or DOCX)
         resume_text: Resume as plain text
+        verbose: Query flag; return the analyzer's full output (score
+            breakdown, skills/experience/context analysis) instead of the
+            compact ATSAnalysisResponse
         
     Returns:
         ATS analysis results with score, keywords, and suggestions
@@ -51,28 +170,27 @@ async def analyze_resume(
         
         # Parse resume
         if resume_file:
-            # Read file content
-            content = await resume_file.read()
+            if resume_file.size is not None and resume_file.size > MAX_UPLOAD_BYTES:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Resume file is too large (max {MAX_UPLOAD_BYTES // (1024 * 1024)} MB)"
+                )
             
             # Determine file type
-            filename = resume_file.filename.lower()
-            if filename.endswith('.pdf'):
-                file_type = 'pdf'
-            elif filename.endswith(('.docx', '.doc')):
-                file_type = 'docx'
-            elif filename.endswith('.txt'):
-                file_type = 'text'
-            else:
+            extension = os.path.splitext(resume_file.filename or "")[1].lower()
+            file_type = _EXTENSION_TO_FILE_TYPE.get(extension)
+            if file_type is None:
                 raise HTTPException(
                     status_code=400,
                     detail="Unsupported file format. Please upload PDF, DOCX, or TXT file."
                 )
             
-            # Parse the file
+            # Parse straight from the upload's spooled temp file rather than
+            # reading the whole body into a bytes object first
             try:
-                parsed_resume = get_analyzer().parse_resume(content, file_type)
+                parsed_resume = await _run_blocking(_parse_cached, resume_file.file, file_type)
             except Exception as parse_error:
-                print(f"Parse error: {str(parse_error)}")
+                logger.warning("Parse error: %s", parse_error, exc_info=True)
                 raise HTTPException(
                     status_code=400,
                     detail=f"Failed to parse resume: {str(parse_error)}"
@@ -90,38 +208,40 @@ async def analyze_resume(
         
         # Perform ATS analysis
         try:
-            analysis_result = get_analyzer().analyze_resume(parsed_resume, job_description)
+            analysis_result = await _run_blocking(
+                get_analyzer().analyze_resume, parsed_resume, job_description
+            )
         except Exception as analysis_error:
-            print(f"Analysis error: {str(analysis_error)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Analysis error: %s", analysis_error)
             raise HTTPException(
                 status_code=500,
                 detail=f"Analysis failed: {str(analysis_error)}"
             )
         
-        return ATSAnalysisResponse(**analysis_result)
+        # FastAPI validates and filters the dict against response_model once;
+        # building ATSAnalysisResponse here would validate it a second time
+        return _analysis_response(analysis_result, verbose)
     
     except HTTPException:
         raise
     except ValueError as e:
-        print(f"ValueError: {str(e)}")
+        logger.warning("ValueError: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Unexpected error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
 @router.post("/analyze-json", response_model=ATSAnalysisResponse)
-async def analyze_resume_json(payload: AnalyzeRequest):
+async def analyze_resume_json(payload: AnalyzeRequest, verbose: bool = False):
     """Analyze resume using JSON payload.
 
     Accepts JSON body with fields:
     - job_description: str (min_length=10)
     - resume_text: Optional[str]
 
+    and the same `verbose` query flag as `/api/analyze`.
+
     This endpoint mirrors `/api/analyze` but expects `application/json` instead of
     `multipart/form-data`.
     """
@@ -136,28 +256,87 @@ async def analyze_resume_json(payload: AnalyzeRequest):
             raise HTTPException(status_code=400, detail="Resume text is too short or missing (min ~50 characters)")
 
         try:
-            analysis_result = get_analyzer().analyze_resume(resume_text, jd)
+            analysis_result = await _run_blocking(get_analyzer().analyze_resume, resume_text, jd)
         except Exception as analysis_error:
-            print(f"Analysis error (JSON): {str(analysis_error)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Analysis error (JSON): %s", analysis_error)
             raise HTTPException(status_code=500, detail=f"Analysis failed: {str(analysis_error)}")
 
-        return ATSAnalysisResponse(**analysis_result)
+        return _analysis_response(analysis_result, verbose)
 
     except HTTPException:
         raise
     except ValueError as e:
-        print(f"ValueError: {str(e)}")
+        logger.warning("ValueError: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Unexpected error (JSON): {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error (JSON): %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+async def _analyze_batch_item(item: BatchAnalyzeItem) -> dict:
+    """Analyze one batch item, reporting a failure as its error instead of raising"""
+    try:
+        if item.resume_file:
+            extension = os.path.splitext(item.filename or "")[1].lower()
+            file_type = _EXTENSION_TO_FILE_TYPE.get(extension)
+            if file_type is None:
+                return {"error": "Unsupported file format. Please upload PDF, DOCX, or TXT file."}
+            
+            try:
+                raw = base64.b64decode(item.resume_file, validate=True)
+            except binascii.Error:
+                return {"error": "resume_file is not valid base64"}
+            if len(raw) > MAX_UPLOAD_BYTES:
+                return {"error": f"Resume file is too large (max {MAX_UPLOAD_BYTES // (1024 * 1024)} MB)"}
+            
+            try:
+                parsed_resume = await _run_blocking(_parse_cached, io.BytesIO(raw), file_type)
+            except Exception as parse_error:
+                logger.warning("Parse error (batch): %s", parse_error, exc_info=True)
+                return {"error": f"Failed to parse resume: {str(parse_error)}"}
+        elif item.resume_text:
+            parsed_resume = item.resume_text
+        else:
+            return {"error": "Either resume_file or resume_text must be provided"}
+        
+        if not parsed_resume or len(parsed_resume.strip()) < 50:
+            return {"error": "Resume content is too short or could not be extracted properly"}
+        
+        return {"analysis": await _run_blocking(
+            get_analyzer().analyze_resume, parsed_resume, item.job_description
+        )}
+    except ValueError as e:
+        logger.warning("ValueError (batch): %s", e)
+        return {"error": str(e)}
+    except Exception as e:
+        logger.exception("Analysis error (batch): %s", e)
+        return {"error": f"Analysis failed: {str(e)}"}
+
+
+@router.post("/analyze_batch", response_model=AnalyzeBatchResponse)
+async def analyze_resume_batch(payload: AnalyzeBatchRequest, verbose: bool = False):
+    """Analyze several resume/job description pairs in one request.
+
+    Each item takes `job_description` plus either `resume_text` or a
+    base64-encoded `resume_file` with its `filename`. Items are analyzed
+    concurrently on the analysis pool, and one failing item does not fail
+    the others: every item gets a result holding either its `analysis` or
+    an `error`, in request order. `verbose` works as on `/api/analyze`.
+    """
+    if len(payload.items) > MAX_BATCH_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many items in batch (max {MAX_BATCH_ITEMS})"
+        )
+    
+    results = await asyncio.gather(*(_analyze_batch_item(item) for item in payload.items))
+    return _analysis_response({"results": list(results)}, verbose)
+
+
 @router.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "Resume ATS Checker"}
+    """Health check endpoint; models_loaded turns true once warmup is done"""
+    return Response(
+        content=_HEALTH_BYTES if _models_loaded else _HEALTH_WARMING_BYTES,
+        media_type="application/json"
+    )
@@ -1,50 +1,130 @@
 """
 AI Resume ATS Checker - Main FastAPI Application
 """
+import asyncio
+import logging
+import logging.handlers
+import os
+import queue
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # Add backend directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+import orjson
 import uvicorn
 
-from api.routes import router
+from api.routes import router, warmup_analyzer, MAX_UPLOAD_BYTES
+
+# Request body limit: the largest resume plus headroom for the job
+# description and multipart framing
+MAX_REQUEST_BYTES = MAX_UPLOAD_BYTES + 1024 * 1024
+
+
+class ContentLengthLimitMiddleware:
+    """Reject requests whose declared Content-Length is too large, before the body is read"""
+    
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_bytes:
+                        response = ORJSONResponse(
+                            {"detail": "Request body is too large"},
+                            status_code=413
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+def _start_log_listener():
+    """Route the app logger through a queue so log I/O happens on a background thread"""
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    app_logger = logging.getLogger("resume_ats")
+    app_logger.setLevel(logging.INFO)
+    app_logger.addHandler(queue_handler)
+    app_logger.propagate = False
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener, queue_handler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the analyzer and its NLP models once per worker, in the background"""
+    log_listener, queue_handler = _start_log_listener()
+    # Model loading is blocking and slow; run it off the event loop without
+    # holding up startup, so /health answers (models_loaded: false) meanwhile.
+    # The reference keeps the task from being garbage collected mid-load.
+    app.state.warmup_task = asyncio.create_task(asyncio.to_thread(warmup_analyzer))
+    yield
+    logging.getLogger("resume_ats").removeHandler(queue_handler)
+    log_listener.stop()
+
 
 app = FastAPI(
     title="AI Resume ATS Checker",
     description="Analyze resume ATS compatibility against job descriptions",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
+# CORS middleware - only the frontend origin(s), comma-separated in FRONTEND_ORIGIN
+FRONTEND_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get("FRONTEND_ORIGIN", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+
+# Added before CORS so that 413 responses still carry CORS headers
+app.add_middleware(ContentLengthLimitMiddleware, max_bytes=MAX_REQUEST_BYTES)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your frontend domain
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=FRONTEND_ORIGINS,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
 )
 
 # Include API routes
 app.include_router(router, prefix="/api", tags=["ATS Analysis"])
 
 
+# Static root payload, serialized once at import
+_ROOT_BYTES = orjson.dumps({
+    "message": "AI Resume ATS Checker API",
+    "version": "1.0.0",
+    "endpoints": {
+        "analyze": "/api/analyze",
+        "analyze-json": "/api/analyze-json",
+        "analyze_batch": "/api/analyze_batch",
+        "health": "/api/health",
+        "docs": "/docs"
+    }
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "AI Resume ATS Checker API",
-        "version": "1.0.0",
-        "endpoints": {
-            "analyze": "/api/analyze",
-            "analyze-json": "/api/analyze-json",
-            "health": "/api/health",
-            "docs": "/docs"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,15 @@
 """Data models"""
-from .schemas import ATSAnalysisResponse, AnalyzeRequest, SectionAnalysis
+from .schemas import (
+    ATSAnalysisResponse,
+    AnalyzeBatchRequest,
+    AnalyzeBatchResponse,
+    AnalyzeRequest,
+    BatchAnalyzeItem,
+    BatchItemResult,
+    SectionAnalysis,
+)
 
-__all__ = ['ATSAnalysisResponse', 'AnalyzeRequest', 'SectionAnalysis']
+__all__ = [
+    'ATSAnalysisResponse', 'AnalyzeBatchRequest', 'AnalyzeBatchResponse', 'AnalyzeRequest',
+    'BatchAnalyzeItem', 'BatchItemResult', 'SectionAnalysis',
+]
@@ -1,6 +1,6 @@
 """Data models for API requests and responses"""
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from typing import Optional
 
 
 class SectionAnalysis(BaseModel):
@@ -13,15 +13,39 @@ class SectionAnalysis(BaseModel):
 class ATSAnalysisResponse(BaseModel):
     """ATS Analysis Response"""
     ats_score: int = Field(..., ge=0, le=100, description="ATS compatibility score (0-100)")
-    matched_keywords: List[str] = Field(..., description="Keywords found in resume matching job description")
-    missing_keywords: List[str] = Field(..., description="Important keywords missing from resume")
+    matched_keywords: list[str] = Field(..., description="Keywords found in resume matching job description")
+    missing_keywords: list[str] = Field(..., description="Important keywords missing from resume")
     section_analysis: SectionAnalysis = Field(..., description="Resume section analysis")
-    suggestions: List[str] = Field(..., description="Improvement suggestions")
+    suggestions: list[str] = Field(..., description="Improvement suggestions")
     keyword_match_rate: float = Field(..., description="Percentage of job keywords found in resume")
-    skill_gaps: List[str] = Field(default=[], description="Identified skill gaps")
+    skill_gaps: list[str] = Field(default=[], description="Identified skill gaps")
 
 
 class AnalyzeRequest(BaseModel):
     """Request model for analyze endpoint"""
     job_description: str = Field(..., min_length=10, description="Job description text")
     resume_text: Optional[str] = Field(None, description="Resume as plain text (if not uploading file)")
+
+
+class BatchAnalyzeItem(BaseModel):
+    """One resume/job description pair in a batch analyze request"""
+    job_description: str = Field(..., min_length=10, description="Job description text")
+    resume_text: Optional[str] = Field(None, description="Resume as plain text (if not sending a file)")
+    resume_file: Optional[str] = Field(None, description="Base64-encoded resume file (PDF, DOCX, or TXT)")
+    filename: Optional[str] = Field(None, description="Name of the encoded file; its extension selects the parser")
+
+
+class AnalyzeBatchRequest(BaseModel):
+    """Request model for batch analyze endpoint"""
+    items: list[BatchAnalyzeItem] = Field(..., min_length=1, description="Pairs to analyze")
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one batch item: its analysis, or why it failed"""
+    analysis: Optional[ATSAnalysisResponse] = Field(None, description="Analysis results, if the item succeeded")
+    error: Optional[str] = Field(None, description="Error message, if the item failed")
+
+
+class AnalyzeBatchResponse(BaseModel):
+    """Batch analyze response, one result per request item in order"""
+    results: list[BatchItemResult]
@@ -1,6 +1,34 @@
-"""Resume parsers for different file formats"""
-from .pdf_parser import PDFParser
-from .docx_parser import DOCXParser
-from .text_parser import TextParser
+"""Resume parsers for different file formats
+
+Parser modules are imported on first attribute access (PEP 562), so importing
+this package doesn't pull in pypdfium2/pdfplumber or python-docx until the
+corresponding parser is actually needed.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .pdf_parser import PDFParser
+    from .docx_parser import DOCXParser
+    from .text_parser import TextParser
 
 __all__ = ['PDFParser', 'DOCXParser', 'TextParser']
+
+_PARSER_MODULES = {
+    'PDFParser': '.pdf_parser',
+    'DOCXParser': '.docx_parser',
+    'TextParser': '.text_parser',
+}
+
+
+def __getattr__(name):
+    module_name = _PARSER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
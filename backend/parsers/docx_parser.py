@@ -1,57 +1,50 @@
 """DOCX Resume Parser"""
-import io
-from typing import Union
+import os
+from typing import BinaryIO, Union
 from docx import Document
+from lxml import etree
+
+from .utils import as_file_source, clean_text
+
+_W_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+# Body and table-cell paragraphs in document order (text boxes are skipped,
+# as python-docx's doc.paragraphs/doc.tables did)
+_PARAGRAPHS = etree.XPath(".//w:p[not(ancestor::w:txbxContent)]", namespaces=_W_NS)
+# Run-level text, tabs and breaks of a single paragraph
+_RUN_TEXT = etree.XPath(
+    "./w:r/w:t | ./w:r/w:tab | ./w:r/w:br | ./w:hyperlink/w:r/w:t",
+    namespaces=_W_NS
+)
 
 
 class DOCXParser:
     """Parse DOCX files and extract text content"""
     
     @staticmethod
-    def extract_text(file_content: Union[bytes, io.BytesIO]) -> str:
+    def extract_text(file_content: Union[bytes, str, os.PathLike, BinaryIO]) -> str:
         """
         Extract text from DOCX file
         
         Args:
-            file_content: DOCX file as bytes or BytesIO object
+            file_content: DOCX file as bytes-like object, a filesystem path, or an open
+                binary file object (e.g. an upload's spooled temp file)
             
         Returns:
             Extracted text as string
         """
-        if isinstance(file_content, bytes):
-            file_content = io.BytesIO(file_content)
-        
         try:
-            doc = Document(file_content)
+            doc = Document(as_file_source(file_content))
             text = []
             
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text.append(paragraph.text)
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text.append(cell.text)
+            # Walk the body XML with lxml's compiled XPath instead of
+            # materializing python-docx Paragraph/Table/Cell wrappers
+            for paragraph in _PARAGRAPHS(doc.element.body):
+                paragraph_text = "".join(node.text or " " for node in _RUN_TEXT(paragraph))
+                if paragraph_text.strip():
+                    text.append(paragraph_text)
             
             return "\n".join(text)
         except Exception as e:
             raise ValueError(f"Error parsing DOCX: {str(e)}")
     
-    @staticmethod
-    def clean_text(text: str) -> str:
-        """
-        Clean and normalize extracted text
-        
-        Args:
-            text: Raw extracted text
-            
-        Returns:
-            Cleaned text
-        """
-        # Remove extra whitespace
-        text = " ".join(text.split())
-        return text.strip()
+    clean_text = staticmethod(clean_text)
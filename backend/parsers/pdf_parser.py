@@ -1,51 +1,72 @@
 """PDF Resume Parser"""
-import io
-from typing import Union
-import pdfplumber
+import os
+import threading
+from typing import BinaryIO, List, Union
+
+from .utils import as_file_source, clean_text
+
+try:
+    # PDFium (C++) extracts text far faster than pdfminer's pure-Python layout
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# PDFium is not thread-safe, even across separate documents, so every pdfium
+# call (open, page/text extraction, close) must hold this lock
+_PDFIUM_LOCK = threading.Lock()
 
 
 class PDFParser:
     """Parse PDF files and extract text content"""
     
     @staticmethod
-    def extract_text(file_content: Union[bytes, io.BytesIO]) -> str:
+    def extract_text(file_content: Union[bytes, str, os.PathLike, BinaryIO]) -> str:
         """
         Extract text from PDF file
         
         Args:
-            file_content: PDF file as bytes or BytesIO object
+            file_content: PDF file as bytes-like object, a filesystem path, or an open
+                binary file object (e.g. an upload's spooled temp file)
             
         Returns:
             Extracted text as string
         """
-        if isinstance(file_content, bytes):
-            file_content = io.BytesIO(file_content)
-        
-        text = ""
         try:
-            with pdfplumber.open(file_content) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+            if pdfium is not None:
+                pages = PDFParser._extract_pages_pdfium(file_content)
+            else:
+                pages = PDFParser._extract_pages_pdfplumber(file_content)
         except Exception as e:
             raise ValueError(f"Error parsing PDF: {str(e)}")
         
-        return text.strip()
+        return "\n".join(page for page in pages if page).strip()
     
     @staticmethod
-    def clean_text(text: str) -> str:
-        """
-        Clean and normalize extracted text
+    def _extract_pages_pdfium(file_content) -> List[str]:
+        """Extract per-page text with pypdfium2 (accepts bytes, paths and files)"""
+        if not isinstance(file_content, bytes):
+            file_content = as_file_source(file_content)
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file_content)
+            try:
+                pages = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    pages.append(textpage.get_text_range())
+                    # Close children here rather than leaving them to
+                    # finalizers that would run outside the lock
+                    textpage.close()
+                    page.close()
+                return pages
+            finally:
+                pdf.close()
+    
+    @staticmethod
+    def _extract_pages_pdfplumber(file_content) -> List[str]:
+        """Extract per-page text with pdfplumber (fallback backend)"""
+        import pdfplumber
         
-        Args:
-            text: Raw extracted text
-            
-        Returns:
-            Cleaned text
-        """
-        # Remove extra whitespace
-        text = " ".join(text.split())
-        # Remove special characters but keep important punctuation
-        text = text.replace("\t", " ").replace("\r", " ")
-        return text.strip()
+        with pdfplumber.open(as_file_source(file_content)) as pdf:
+            return [page.extract_text() for page in pdf.pages]
+    
+    clean_text = staticmethod(clean_text)
@@ -1,4 +1,5 @@
 """Plain Text Parser"""
+from .utils import clean_text
 
 
 class TextParser:
@@ -17,19 +18,4 @@ class TextParser:
         """
         return text.strip()
     
-    @staticmethod
-    def clean_text(text: str) -> str:
-        """
-        Clean and normalize text
-        
-        Args:
-            text: Raw text
-            
-        Returns:
-            Cleaned text
-        """
-        # Remove extra whitespace
-        text = " ".join(text.split())
-        # Remove special characters but keep important punctuation
-        text = text.replace("\t", " ").replace("\r", " ")
-        return text.strip()
+    clean_text = staticmethod(clean_text)
@@ -0,0 +1,38 @@
+"""Shared helpers for the resume parsers"""
+import io
+
+# In-memory file contents accepted by the parsers (anything BytesIO can wrap)
+BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+
+def as_file_source(file_content):
+    """
+    Wrap in-memory file contents in a BytesIO; paths and open files pass through
+    
+    Args:
+        file_content: bytes-like object, filesystem path, or binary file object
+        
+    Returns:
+        Something pdfplumber/python-docx can open
+    """
+    if isinstance(file_content, BUFFER_TYPES):
+        return io.BytesIO(file_content)
+    return file_content
+
+
+def clean_text(text: str) -> str:
+    """
+    Clean and normalize extracted text
+    
+    Collapses every run of whitespace (spaces, tabs, newlines, \\r, \\v, \\f)
+    into a single space and trims the ends. str.split() treats exactly the
+    characters regex \\s matches as whitespace, and split/join runs in C
+    without the regex engine.
+    
+    Args:
+        text: Raw extracted text
+        
+    Returns:
+        Cleaned text
+    """
+    return " ".join(text.split())
@@ -1,5 +1,32 @@
-"""Services for resume analysis"""
-from .ats_scorer import ATSScorer
-from .resume_analyzer import ResumeAnalyzer
+"""Services for resume analysis
+
+Service modules are imported on first attribute access (PEP 562), so importing
+one service (e.g. services.resume_analyzer) doesn't load the scorer module
+until it is actually needed.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ats_scorer import ATSScorer
+    from .resume_analyzer import ResumeAnalyzer
 
 __all__ = ['ATSScorer', 'ResumeAnalyzer']
+
+_SERVICE_MODULES = {
+    'ATSScorer': '.ats_scorer',
+    'ResumeAnalyzer': '.resume_analyzer',
+}
+
+
+def __getattr__(name):
+    module_name = _SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,110 @@
 """ATS Scoring Service - Advanced Analysis Engine with Claude-level Accuracy"""
+import os
 import re
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import filterfalse, islice
 from typing import List, Dict, Tuple, Set, Optional
-from collections import Counter, defaultdict
-import numpy as np
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
 
+from .embedding_batcher import EmbeddingBatcher
+from .utils import content_hash
+
+try:
+    # Aho-Corasick finds every keyword inside a string in one linear C pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Quantize the sentence-transformer to int8 when it runs on CPU. Set
+# SEMANTIC_MODEL_INT8=0 to keep full FP32 precision.
+SEMANTIC_MODEL_INT8 = os.environ.get("SEMANTIC_MODEL_INT8", "1") != "0"
+
+
+# Models are loaded once per process and shared by every ATSScorer instance,
+# so creating another scorer (scripts, tests, a reset analyzer) does not pay
+# the multi-second load again. Failed loads raise and are not cached.
+@lru_cache(maxsize=None)
+def _load_spacy_model(name: str, exclude: Tuple[str, ...]):
+    """Load a spaCy pipeline without the excluded components"""
+    import spacy
+    return spacy.load(name, exclude=list(exclude))
+
+
+@lru_cache(maxsize=None)
+def _load_sentence_model(name: str):
+    """Load a sentence-transformers model: FP16 on a GPU, int8 Linear layers on CPU"""
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(name)
+    if model.device.type == 'cuda':
+        # FP16 halves memory traffic and uses tensor cores on GPU
+        model.half()
+    elif SEMANTIC_MODEL_INT8:
+        try:
+            import torch
+            # Dynamic int8 quantization of the transformer's Linear layers, where
+            # CPU inference spends its time; cosine scores move by well under 1%
+            transformer = model[0]
+            transformer.auto_model = torch.ao.quantization.quantize_dynamic(
+                transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        except Exception as e:
+            print(f"Note: int8 quantization unavailable ({e}). Using FP32 semantic model.")
+    return model
+
+
+@lru_cache(maxsize=None)
+def _load_embedding_batcher(name: str) -> EmbeddingBatcher:
+    """One encode worker per model, so concurrent analyses share its batches"""
+    return EmbeddingBatcher(_load_sentence_model(name))
+
+
+# lru_cache does not stop several threads from computing the same missing
+# entry at once, so ATSScorer's _ensure_* loaders take this lock: a model is
+# loaded by one thread while the others wait for it
+_model_load_lock = threading.Lock()
+
+
+# Worker threads for the independent stages of ATSScorer.analyze, shared by
+# all instances. Every request thread of the API's analysis pool
+# (ANALYSIS_WORKERS, CPU count by default) fans out ANALYSIS_STAGES tasks, so
+# the default gives each concurrent analysis its own set of stage threads
+# instead of queueing all requests behind a few. Override with
+# ANALYSIS_STAGE_WORKERS.
+ANALYSIS_STAGES = 5
+ANALYSIS_STAGE_WORKERS = int(os.environ.get(
+    "ANALYSIS_STAGE_WORKERS",
+    str(ANALYSIS_STAGES * int(os.environ.get("ANALYSIS_WORKERS", str(os.cpu_count() or 1))))
+))
+_stage_executor_instance = None
+_stage_executor_lock = threading.Lock()
+
+
+def _stage_executor() -> ThreadPoolExecutor:
+    """Create the shared stage executor on first use"""
+    global _stage_executor_instance
+    if _stage_executor_instance is None:
+        with _stage_executor_lock:
+            if _stage_executor_instance is None:
+                _stage_executor_instance = ThreadPoolExecutor(
+                    max_workers=ANALYSIS_STAGE_WORKERS,
+                    thread_name_prefix="ats-stage",
+                )
+    return _stage_executor_instance
+
+
+def _index_skill_families(families: List[Set[str]]) -> Dict[str, frozenset]:
+    """Map each skill to the indices of the families that contain it"""
+    index = defaultdict(set)
+    for i, family in enumerate(families):
+        for skill in family:
+            index[skill].add(i)
+    return {skill: frozenset(ids) for skill, ids in index.items()}
+
 
 class ATSScorer:
     """
@@ -38,6 +138,37 @@ class ATSScorer:
         'collaboration': ['collaborated', 'partnered', 'coordinated', 'facilitated', 'contributed', 'supported']
     }
     
+    # Weighted scoring components:
+    SCORE_WEIGHTS = {
+        'keyword_match': 0.25,      # 25% - Direct keyword matching
+        'content_similarity': 0.25,  # 25% - Semantic/TF-IDF similarity
+        'skills_coverage': 0.20,     # 20% - Skills match
+        'experience_quality': 0.15,  # 15% - Experience depth
+        'context_alignment': 0.10,   # 10% - Contextual usage
+        'section_structure': 0.05    # 5%  - Resume structure
+    }
+    
+    # Common English stopwords skipped by the regex keyword fallback
+    FALLBACK_STOP_WORDS = frozenset({
+        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'is', 'are', 'was',
+        'were', 'be', 'have', 'has', 'had', 'do', 'does', 'did', 'that', 'this', 'which', 'who', 'what', 'where',
+        'when', 'why', 'how', 'as', 'from', 'by', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
+        'above', 'below', 'between', 'under', 'again', 'further', 'then', 'once'
+    })
+    
+    # Determiners marking a noun chunk as a phrase rather than a skill name
+    _NON_SKILL_MARKERS = ('the ', 'this ', 'that ', 'these ', 'those ')
+    
+    # Groups of related skills, counted as partial matches for each other
+    SKILL_FAMILIES = [
+        {'python', 'django', 'flask', 'fastapi', 'pandas', 'numpy'},
+        {'javascript', 'typescript', 'react', 'angular', 'vue', 'node.js', 'nodejs'},
+        {'aws', 'azure', 'gcp', 'cloud', 'lambda', 'ec2', 's3'},
+        {'docker', 'kubernetes', 'k8s', 'containers', 'devops'},
+        {'sql', 'mysql', 'postgresql', 'database', 'nosql', 'mongodb'},
+        {'machine learning', 'deep learning', 'ai', 'tensorflow', 'pytorch', 'data science'},
+    ]
+    
     # Quantifiable metrics patterns
     METRIC_PATTERNS = [
         r'\d+%',  # Percentages
@@ -48,6 +179,51 @@ class ATSScorer:
         r'\d+\s*(users?|customers?|clients?|people|employees|team members?)',  # Scale
     ]
     
+    # Comprehensive technical skills patterns (expanded significantly)
+    TECH_SKILL_PATTERNS = {
+        'programming': r'\b(python|java|javascript|typescript|c\+\+|c#|golang|go|rust|scala|kotlin|swift|ruby|php|perl|r|matlab|julia|dart|flutter|react native|objective-c)\b',
+        'web_frontend': r'\b(react|angular|vue|svelte|next\.?js|nuxt|ember|backbone|jquery|html5?|css3?|sass|scss|less|tailwind|bootstrap|material ui|webpack|vite|parcel)\b',
+        'web_backend': r'\b(node\.?js|express|django|flask|fastapi|spring boot?|spring|\.net|asp\.net|rails|laravel|symfony|nestjs|koa|hapi)\b',
+        'mobile': r'\b(ios|android|react native|flutter|xamarin|ionic|cordova|swift|kotlin|objective-c|swiftui)\b',
+        'databases': r'\b(sql|nosql|mysql|postgresql|postgres|mongodb|cassandra|redis|elasticsearch|dynamodb|oracle|sql server|mariadb|couchdb|neo4j|graph database)\b',
+        'cloud': r'\b(aws|azure|gcp|google cloud|cloud platform|heroku|digitalocean|lambda|ec2|s3|cloudfront|cloud functions|cloud run|kubernetes|k8s|docker|containers|serverless)\b',
+        'devops': r'\b(docker|kubernetes|k8s|jenkins|gitlab ci|github actions|circle ci|travis|terraform|ansible|puppet|chef|ci/cd|continuous integration|continuous deployment|devops)\b',
+        'data_science': r'\b(machine learning|deep learning|ai|artificial intelligence|data science|data analysis|tensorflow|pytorch|keras|scikit-learn|pandas|numpy|scipy|jupyter|data visualization|statistics|nlp|computer vision|neural networks?)\b',
+        'tools': r'\b(git|github|gitlab|bitbucket|jira|confluence|slack|trello|asana|vs code|visual studio|intellij|eclipse|postman|swagger|figma|sketch|adobe xd)\b',
+        'methodologies': r'\b(agile|scrum|kanban|waterfall|devops|tdd|test[- ]driven|bdd|ci/cd|microservices|rest|restful|graphql|api|soap|mvc|mvvm|solid|design patterns?)\b',
+        'soft_skills': r'\b(leadership|communication|problem[- ]solving|analytical|critical thinking|team work|collaboration|project management|time management|adaptability|creativity|mentoring|presentation)\b'
+    }
+    
+    # Compiled once at import instead of re-resolved through re's cache per call.
+    # Categories stay separate patterns: a single alternation would report only
+    # one category's match per position (e.g. 'github actions' would hide 'github')
+    _TECH_SKILL_REGEXES = {category: re.compile(pattern) for category, pattern in TECH_SKILL_PATTERNS.items()}
+    _METRIC_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in METRIC_PATTERNS]
+    # Section keyword -> section, scanned with one zero-width alternation so every
+    # start offset is tried (the same hits as a plain substring test). No keyword
+    # of one section is a prefix of another section's, so no section is shadowed
+    _SECTION_BY_KEYWORD = {
+        keyword: section for section, keywords in SECTION_KEYWORDS.items() for keyword in keywords
+    }
+    _SECTION_KEYWORDS_RE = re.compile(
+        '(?=(' + '|'.join(re.escape(keyword) for keyword in _SECTION_BY_KEYWORD) + '))'
+    )
+    # Skill -> indices of the SKILL_FAMILIES containing it
+    _SKILL_FAMILY_IDS = _index_skill_families(SKILL_FAMILIES)
+    _WORD_RE = re.compile(r'\w+')
+    _NON_SPACE_RE = re.compile(r'\S+')
+    _KEYWORD_TOKEN_RE = re.compile(r'\b\w{3,}\b')  # Fallback keyword tokens
+    
+    # Number of distinct texts memoized per extraction step
+    TEXT_CACHE_SIZE = 256
+    # Number of sentence embeddings kept in the LRU cache
+    EMBEDDINGS_CACHE_SIZE = 4096
+    # Characters of each text that are analyzed; real resumes and job
+    # descriptions are far shorter, this only bounds pathological inputs
+    MAX_ANALYSIS_CHARS = 50_000
+    # Keyword occurrences whose surrounding words feed the context overlap
+    MAX_KEYWORD_CONTEXTS = 20
+    
     def __init__(self):
         """Initialize the Advanced ATS Scorer"""
         self.nlp = None  # Lazy-load on first use
@@ -55,63 +231,94 @@ class ATSScorer:
         self.tfidf_vectorizer = None  # Lazy-load on first use
         self._use_fallback = False
         self.sentence_model = None  # For semantic similarity
-        self._embeddings_cache = {}  # Cache for embeddings
+        self._embedding_batcher = None  # Created with the sentence model
+        self._embeddings_cache = OrderedDict()  # LRU of text digest -> embedding
+        self._embeddings_lock = threading.Lock()
+        
+        # Per-instance memoization of the text -> features steps, so analyzing
+        # the same resume or job description again (retries, one resume against
+        # several JDs) skips the tokenization and spaCy work
+        self._normalize_cache = lru_cache(maxsize=self.TEXT_CACHE_SIZE)(self._normalize_text)
+        self._keywords_cache = lru_cache(maxsize=self.TEXT_CACHE_SIZE)(self._extract_keywords)
+        self._skills_cache = lru_cache(maxsize=self.TEXT_CACHE_SIZE)(self._extract_skills)
+        self._term_vector_cache = lru_cache(maxsize=self.TEXT_CACHE_SIZE)(self._term_vector)
     
     def _ensure_nlp_loaded(self):
         """Ensure spaCy model is loaded - using fallback if issues occur"""
-        if self.nlp is None:
-            try:
-                # Suppress pydantic warnings during import
-                import warnings
-                warnings.filterwarnings('ignore', category=DeprecationWarning)
+        if self.nlp is None and not self._use_fallback:
+            with _model_load_lock:
+                if self.nlp is None and not self._use_fallback:
+                    try:
+                        # Suppress pydantic warnings during import
+                        import warnings
+                        warnings.filterwarnings('ignore', category=DeprecationWarning)
                 
-                import sys
-                import os
-                # Suppress pydantic v1 compatibility warnings
-                os.environ["PYDANTIC_V1_COMPATIBILITY_MODE"] = "1"
+                        import sys
+                        import os
+                        # Suppress pydantic v1 compatibility warnings
+                        os.environ["PYDANTIC_V1_COMPATIBILITY_MODE"] = "1"
                 
-                print("Loading spaCy model (this may take a moment)...")
-                import spacy
-                self.nlp = spacy.load("en_core_web_sm")
-                print("spaCy model loaded successfully")
-            except Exception as e:
-                print(f"Note: Could not load spacy ({e}). Using fallback NLTK tokenization.")
-                # Fallback mode - we'll use simple tokenization instead
-                self.nlp = None
-                self._use_fallback = True
+                        print("Loading spaCy model (this may take a moment)...")
+                        # Only POS tags and noun chunks are used: keep tok2vec, tagger,
+                        # attribute_ruler (maps tags to POS) and parser (noun_chunks)
+                        self.nlp = _load_spacy_model("en_core_web_sm", ("ner", "lemmatizer"))
+                        print("spaCy model loaded successfully")
+                    except Exception as e:
+                        print(f"Note: Could not load spacy ({e}). Using fallback NLTK tokenization.")
+                        # Fallback mode - we'll use simple tokenization instead
+                        self.nlp = None
+                        self._use_fallback = True
     
     def _ensure_tfidf_loaded(self):
-        """Ensure TF-IDF vectorizer is initialized with optimal parameters"""
+        """Ensure the term vectorizer is initialized with optimal parameters"""
         if self.tfidf_vectorizer is None:
-            from sklearn.feature_extraction.text import TfidfVectorizer
-            self.tfidf_vectorizer = TfidfVectorizer(
-                max_features=1000,  # Increased for better coverage
-                stop_words='english',
-                ngram_range=(1, 3),  # Unigrams, bigrams, and trigrams
-                min_df=1,
-                max_df=0.95,  # Ignore terms that appear in >95% of documents
-                sublinear_tf=True  # Use logarithmic TF scaling
-            )
+            with _model_load_lock:
+                if self.tfidf_vectorizer is None:
+                    import numpy as np
+                    from sklearn.feature_extraction.text import HashingVectorizer
+                    # Stateless: no per-request fit, and nothing is shared between
+                    # threads. (A TfidfVectorizer refit on just the two documents with
+                    # max_df=0.95 discarded every shared term, so the score was always 0.)
+                    self.tfidf_vectorizer = HashingVectorizer(
+                        n_features=2 ** 18,
+                        stop_words='english',
+                        ngram_range=(1, 3),  # Unigrams, bigrams, and trigrams
+                        alternate_sign=False,  # Keep term counts non-negative
+                        norm=None,  # Normalized after sublinear TF scaling
+                        dtype=np.float32  # Half the memory of float64; ample for a 0-1 score
+                    )
     
     def _ensure_embeddings_loaded(self):
         """Ensure sentence transformer model is loaded for semantic similarity"""
         if self.sentence_model is None:
-            try:
-                from sentence_transformers import SentenceTransformer
-                print("Loading semantic model for deep analysis...")
-                self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
-                print("Semantic model loaded successfully")
-            except Exception as e:
-                print(f"Note: Semantic embeddings unavailable ({e}). Using TF-IDF fallback.")
-                self.sentence_model = False  # Mark as unavailable
+            with _model_load_lock:
+                if self.sentence_model is None:
+                    try:
+                        print("Loading semantic model for deep analysis...")
+                        # Batcher first: other threads check sentence_model
+                        # without the lock and then use the batcher
+                        self._embedding_batcher = _load_embedding_batcher('all-MiniLM-L6-v2')
+                        self.sentence_model = _load_sentence_model('all-MiniLM-L6-v2')
+                        print("Semantic model loaded successfully")
+                    except Exception as e:
+                        print(f"Note: Semantic embeddings unavailable ({e}). Using TF-IDF fallback.")
+                        self.sentence_model = False  # Mark as unavailable
+    
+    def warmup(self):
+        """Eagerly load the spaCy, TF-IDF and embedding models"""
+        self._ensure_nlp_loaded()
+        self._ensure_tfidf_loaded()
+        self._ensure_embeddings_loaded()
     
     def normalize_text(self, text: str) -> str:
         """Normalize text for analysis"""
-        # Convert to lowercase
-        text = text.lower()
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return self._normalize_cache(text)
+    
+    def _normalize_text(self, text: str) -> str:
+        """Uncached body of normalize_text"""
+        # Lowercase, then collapse whitespace runs and trim in one split/join
+        # (str.split() splits on exactly what regex \s matches)
+        return ' '.join(text.lower().split())
     
     def extract_keywords(self, text: str, top_n: int = 50) -> List[str]:
         """
@@ -124,19 +331,19 @@ class ATSScorer:
         Returns:
             List of keywords
         """
+        return list(self._keywords_cache(text, top_n))
+    
+    def _extract_keywords(self, text: str, top_n: int) -> Tuple[str, ...]:
+        """Uncached body of extract_keywords (returns an immutable tuple for the cache)"""
         self._ensure_nlp_loaded()
         
         # Check if we're using spacy or fallback
         if self.nlp is None:
             # Fallback: Simple regex-based keyword extraction
-            # Common English stopwords
-            stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'is', 'are', 'was', 'were', 'be', 'have', 'has', 'had', 'do', 'does', 'did', 'that', 'this', 'which', 'who', 'what', 'where', 'when', 'why', 'how', 'as', 'from', 'by', 'up', 'about', 'into', 'through', 'during', 'before', 'after', 'above', 'below', 'between', 'under', 'again', 'further', 'then', 'once'}
-            
-            # Extract words
-            words = re.findall(r'\b\w{3,}\b', text.lower())
-            keywords = [w for w in words if w not in stop_words]
-            keyword_counts = Counter(keywords)
-            return [kw for kw, _ in keyword_counts.most_common(top_n)]
+            # Extract words; filtering and counting both run in C
+            words = self._KEYWORD_TOKEN_RE.findall(text.lower())
+            keyword_counts = Counter(filterfalse(self.FALLBACK_STOP_WORDS.__contains__, words))
+            return tuple(kw for kw, _ in keyword_counts.most_common(top_n))
         
         # Use spacy if available
         try:
@@ -157,12 +364,12 @@ class ATSScorer:
             
             # Count frequency and return top keywords
             keyword_counts = Counter(keywords)
-            return [kw for kw, _ in keyword_counts.most_common(top_n)]
+            return tuple(kw for kw, _ in keyword_counts.most_common(top_n))
         except:
             # Fallback to regex if spacy fails
-            words = re.findall(r'\b\w{3,}\b', text.lower())
+            words = self._KEYWORD_TOKEN_RE.findall(text.lower())
             keyword_counts = Counter(words)
-            return [kw for kw, _ in keyword_counts.most_common(top_n)]
+            return tuple(kw for kw, _ in keyword_counts.most_common(top_n))
     
     def calculate_tfidf_similarity(self, resume_text: str, job_description: str) -> float:
         """
@@ -176,19 +383,32 @@ class ATSScorer:
             Similarity score (0-1)
         """
         try:
-            # Ensure vectorizer is loaded
-            self._ensure_tfidf_loaded()
+            resume_vector = self._term_vector_cache(resume_text)
+            job_vector = self._term_vector_cache(job_description)
             
-            # Create TF-IDF vectors
-            from sklearn.metrics.pairwise import cosine_similarity
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform([resume_text, job_description])
-            
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            # Rows are L2-normalized, so the cosine similarity is the sparse
+            # dot product of the two rows
+            similarity = resume_vector.multiply(job_vector).sum()
             return float(similarity)
         except Exception:
             return 0.0
     
+    def _term_vector(self, text: str):
+        """
+        Uncached term vector of one text: hashed n-gram counts with logarithmic
+        TF scaling (1 + log(tf)), L2-normalized. Cached rows are shared between
+        calls, so they must not be modified in place.
+        """
+        # Ensure vectorizer is loaded
+        self._ensure_tfidf_loaded()
+        
+        import numpy as np
+        from sklearn.preprocessing import normalize
+        vector = self.tfidf_vectorizer.transform([text])
+        np.log(vector.data, out=vector.data)
+        vector.data += 1
+        return normalize(vector, copy=False)
+    
     def find_keyword_matches(
         self, 
         resume_keywords: List[str], 
@@ -204,29 +424,61 @@ class ATSScorer:
         Returns:
             Tuple of (matched_keywords, missing_keywords, match_rate)
         """
-        resume_set = set(resume_keywords)
-        job_set = set(job_keywords)
-        
-        # Find exact matches
-        matched = list(resume_set.intersection(job_set))
-        
-        # Find partial matches (substring matching for compound skills)
+        resume_set = frozenset(resume_keywords)
+        job_set = frozenset(job_keywords)
+        
+        # Find exact matches (kept as a set for O(1) membership checks below)
+        matched_set = resume_set.intersection(job_set)
+        matched = list(matched_set)
+        
+        # Find partial matches (substring matching for compound skills).
+        # "job_kw inside some resume keyword" is one C-level substring search
+        # over all resume keywords joined, instead of a Python loop per pair
+        resume_haystack = self._join_for_search(resume_set)
+        contains_resume_kw = self._substring_matcher(resume_set)
         partial_matches = []
         for job_kw in job_set:
-            if job_kw not in matched:
-                for resume_kw in resume_set:
-                    if job_kw in resume_kw or resume_kw in job_kw:
-                        partial_matches.append(job_kw)
-                        break
+            if job_kw not in matched_set:
+                if job_kw in resume_haystack or contains_resume_kw(job_kw):
+                    partial_matches.append(job_kw)
         
         all_matched = matched + partial_matches
-        missing = [kw for kw in job_set if kw not in all_matched]
+        matched_set = matched_set.union(partial_matches)
+        missing = [kw for kw in job_set if kw not in matched_set]
         
         # Calculate match rate
         match_rate = len(all_matched) / len(job_set) if job_set else 0.0
         
         return all_matched, missing, match_rate
     
+    @staticmethod
+    def _substring_matcher(terms):
+        """
+        Build a predicate telling whether a string contains any of the terms
+        
+        Uses an Aho-Corasick automaton over the terms when pyahocorasick is
+        installed (one pass over the string regardless of how many terms), and
+        a per-term substring scan otherwise.
+        """
+        if ahocorasick is None or not terms:
+            return lambda text: any(term in text for term in terms)
+        
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    @staticmethod
+    def _join_for_search(terms) -> str:
+        """
+        Join terms into one string for substring tests
+        
+        `needle in joined` is True exactly when the needle occurs inside one of
+        the terms, since the NUL separator never appears in extracted text.
+        """
+        return '\x00'.join(terms)
+    
     def detect_sections(self, resume_text: str) -> Dict[str, bool]:
         """
         Detect presence of key resume sections
@@ -239,9 +491,17 @@ class ATSScorer:
         """
         text_lower = resume_text.lower()
         
-        sections = {}
-        for section_name, keywords in self.SECTION_KEYWORDS.items():
-            sections[section_name] = any(keyword in text_lower for keyword in keywords)
+        # One pass over the text instead of a substring scan per keyword,
+        # stopping as soon as every section has been seen
+        sections = dict.fromkeys(self.SECTION_KEYWORDS, False)
+        remaining = len(sections)
+        for match in self._SECTION_KEYWORDS_RE.finditer(text_lower):
+            section_name = self._SECTION_BY_KEYWORD[match.group(1)]
+            if not sections[section_name]:
+                sections[section_name] = True
+                remaining -= 1
+                if not remaining:
+                    break
         
         return sections
     
@@ -255,28 +515,16 @@ class ATSScorer:
         Returns:
             List of identified skills
         """
-        # Comprehensive technical skills patterns (expanded significantly)
-        tech_patterns = {
-            'programming': r'\b(python|java|javascript|typescript|c\+\+|c#|golang|go|rust|scala|kotlin|swift|ruby|php|perl|r|matlab|julia|dart|flutter|react native|objective-c)\b',
-            'web_frontend': r'\b(react|angular|vue|svelte|next\.?js|nuxt|ember|backbone|jquery|html5?|css3?|sass|scss|less|tailwind|bootstrap|material ui|webpack|vite|parcel)\b',
-            'web_backend': r'\b(node\.?js|express|django|flask|fastapi|spring boot?|spring|\.net|asp\.net|rails|laravel|symfony|nestjs|koa|hapi)\b',
-            'mobile': r'\b(ios|android|react native|flutter|xamarin|ionic|cordova|swift|kotlin|objective-c|swiftui)\b',
-            'databases': r'\b(sql|nosql|mysql|postgresql|postgres|mongodb|cassandra|redis|elasticsearch|dynamodb|oracle|sql server|mariadb|couchdb|neo4j|graph database)\b',
-            'cloud': r'\b(aws|azure|gcp|google cloud|cloud platform|heroku|digitalocean|lambda|ec2|s3|cloudfront|cloud functions|cloud run|kubernetes|k8s|docker|containers|serverless)\b',
-            'devops': r'\b(docker|kubernetes|k8s|jenkins|gitlab ci|github actions|circle ci|travis|terraform|ansible|puppet|chef|ci/cd|continuous integration|continuous deployment|devops)\b',
-            'data_science': r'\b(machine learning|deep learning|ai|artificial intelligence|data science|data analysis|tensorflow|pytorch|keras|scikit-learn|pandas|numpy|scipy|jupyter|data visualization|statistics|nlp|computer vision|neural networks?)\b',
-            'tools': r'\b(git|github|gitlab|bitbucket|jira|confluence|slack|trello|asana|vs code|visual studio|intellij|eclipse|postman|swagger|figma|sketch|adobe xd)\b',
-            'methodologies': r'\b(agile|scrum|kanban|waterfall|devops|tdd|test[- ]driven|bdd|ci/cd|microservices|rest|restful|graphql|api|soap|mvc|mvvm|solid|design patterns?)\b',
-            'soft_skills': r'\b(leadership|communication|problem[- ]solving|analytical|critical thinking|team work|collaboration|project management|time management|adaptability|creativity|mentoring|presentation)\b'
-        }
-        
+        return list(self._skills_cache(text))
+    
+    def _extract_skills(self, text: str) -> Tuple[str, ...]:
+        """Uncached body of extract_skills (returns an immutable tuple for the cache)"""
         skills = []
         text_lower = text.lower()
         
         # Extract using all patterns
-        for category, pattern in tech_patterns.items():
-            found = re.findall(pattern, text_lower)
-            skills.extend(found)
+        for regex in self._TECH_SKILL_REGEXES.values():
+            skills.extend(regex.findall(text_lower))
         
         # Also extract from noun phrases if spacy is available
         self._ensure_nlp_loaded()
@@ -288,21 +536,14 @@ class ATSScorer:
                     # Skills are typically 1-4 words
                     if 1 <= len(chunk_text.split()) <= 4:
                         # Filter out common non-skill phrases
-                        if not any(x in chunk_text for x in ['the ', 'this ', 'that ', 'these ', 'those ']):
+                        if not any(x in chunk_text for x in self._NON_SKILL_MARKERS):
                             skills.append(chunk_text)
             except:
                 pass  # Ignore errors, we already have regex-based skills
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_skills = []
-        for skill in skills:
-            skill_normalized = skill.strip().lower()
-            if skill_normalized and skill_normalized not in seen and len(skill_normalized) > 1:
-                seen.add(skill_normalized)
-                unique_skills.append(skill_normalized)
-        
-        return unique_skills
+        # Remove duplicates while preserving order (dicts keep insertion order)
+        normalized = (skill.strip().lower() for skill in skills)
+        return tuple(dict.fromkeys(skill for skill in normalized if len(skill) > 1))
     
     def calculate_semantic_similarity(self, resume_text: str, job_description: str) -> float:
         """
@@ -320,18 +561,10 @@ class ATSScorer:
         
         if self.sentence_model and self.sentence_model is not False:
             try:
-                # Generate embeddings
-                resume_embedding = self.sentence_model.encode(resume_text, show_progress_bar=False)
-                job_embedding = self.sentence_model.encode(job_description, show_progress_bar=False)
-                
-                # Calculate cosine similarity
-                from sklearn.metrics.pairwise import cosine_similarity
-                similarity = cosine_similarity(
-                    resume_embedding.reshape(1, -1),
-                    job_embedding.reshape(1, -1)
-                )[0][0]
+                # Unit-length embeddings, so the cosine similarity is the dot product
+                resume_embedding, job_embedding = self._embed([resume_text, job_description])
                 
-                return float(similarity)
+                return float(resume_embedding @ job_embedding)
             except Exception as e:
                 print(f"Semantic similarity calculation failed: {e}")
                 return self.calculate_tfidf_similarity(resume_text, job_description)
@@ -339,6 +572,39 @@ class ATSScorer:
             # Fallback to TF-IDF
             return self.calculate_tfidf_similarity(resume_text, job_description)
     
+    def _embed(self, texts: List[str]) -> List:
+        """
+        Encode texts to unit-normalized embeddings, reusing cached vectors
+        
+        Texts are keyed by a 16-byte BLAKE2b digest; only cache misses are sent
+        to the model, batched with any other analyses encoding at the same time.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One embedding vector per input text
+        """
+        keys = [content_hash(text) for text in texts]
+        
+        with self._embeddings_lock:
+            vectors = [self._embeddings_cache.get(key) for key in keys]
+            for key, vector in zip(keys, vectors):
+                if vector is not None:
+                    self._embeddings_cache.move_to_end(key)
+        
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            encoded = self._embedding_batcher.encode([texts[i] for i in missing])
+            with self._embeddings_lock:
+                for i, vector in zip(missing, encoded):
+                    vectors[i] = vector
+                    self._embeddings_cache[keys[i]] = vector
+                while len(self._embeddings_cache) > self.EMBEDDINGS_CACHE_SIZE:
+                    self._embeddings_cache.popitem(last=False)
+        
+        return vectors
+    
     def analyze_experience_depth(self, text: str) -> Dict:
         """
         Analyze the depth and quality of experience descriptions
@@ -351,16 +617,15 @@ class ATSScorer:
         """
         text_lower = text.lower()
         
-        # Count action verbs by category
+        # Count action verbs by category from a single tokenization pass
+        # (every verb is one word, so a token match equals a \bverb\b match)
+        word_counts = Counter(self._WORD_RE.findall(text_lower))
         action_verb_counts = defaultdict(int)
         for category, verbs in self.ACTION_VERBS.items():
-            for verb in verbs:
-                action_verb_counts[category] += len(re.findall(r'\b' + verb + r'\b', text_lower))
+            action_verb_counts[category] = sum(word_counts[verb] for verb in verbs)
         
         # Count quantifiable achievements
-        metric_count = 0
-        for pattern in self.METRIC_PATTERNS:
-            metric_count += len(re.findall(pattern, text, re.IGNORECASE))
+        metric_count = sum(len(regex.findall(text)) for regex in self._METRIC_REGEXES)
         
         # Calculate experience strength score
         total_action_verbs = sum(action_verb_counts.values())
@@ -398,15 +663,16 @@ class ATSScorer:
         Returns:
             Context analysis results
         """
-        resume_lower = resume_text.lower()
-        job_lower = job_description.lower()
+        # Tokenize each text once; every keyword below reuses the word spans
+        resume_words = self._word_spans(resume_text.lower())
+        job_words = self._word_spans(job_description.lower())
         
         context_scores = {}
         
         for keyword in keywords[:20]:  # Analyze top 20 keywords
             # Find keyword in context (surrounding words)
-            resume_contexts = self._extract_keyword_contexts(resume_lower, keyword)
-            job_contexts = self._extract_keyword_contexts(job_lower, keyword)
+            resume_contexts = self._keyword_context_words(resume_words, keyword)
+            job_contexts = self._keyword_context_words(job_words, keyword)
             
             if resume_contexts and job_contexts:
                 # Calculate context similarity
@@ -418,7 +684,8 @@ class ATSScorer:
                 context_scores[keyword] = 0.0  # Not present
         
         # Average context score
-        avg_context_score = np.mean(list(context_scores.values())) if context_scores else 0.0
+        # Plain sum/len: at most 20 floats, too few for an ndarray to pay off
+        avg_context_score = sum(context_scores.values()) / len(context_scores) if context_scores else 0.0
         
         return {
             'context_scores': context_scores,
@@ -426,32 +693,39 @@ class ATSScorer:
             'well_contextualized_keywords': sum(1 for score in context_scores.values() if score > 0.6)
         }
     
-    def _extract_keyword_contexts(self, text: str, keyword: str, window: int = 5) -> List[str]:
-        """Extract words surrounding a keyword"""
-        words = text.split()
-        contexts = []
-        
-        for i, word in enumerate(words):
-            if keyword in word:
-                start = max(0, i - window)
-                end = min(len(words), i + window + 1)
-                context = ' '.join(words[start:end])
-                contexts.append(context)
-        
-        return contexts
+    @classmethod
+    def _word_spans(cls, text: str) -> Tuple[str, List[int], List[str]]:
+        """Split text on whitespace, keeping each word's start offset for bisect lookups"""
+        word_starts = []
+        words = []
+        for match in cls._NON_SPACE_RE.finditer(text):
+            word_starts.append(match.start())
+            words.append(match.group())
+        return text, word_starts, words
+    
+    def _keyword_context_words(self, word_spans: Tuple[str, List[int], List[str]],
+                               keyword: str, window: int = 5) -> Set[str]:
+        """Collect the words surrounding each whole-word occurrence of a keyword"""
+        text, word_starts, words = word_spans
+        pattern = re.compile(r'(?<!\w)' + re.escape(keyword) + r'(?!\w)')
+        context_words = set()
+        
+        for match in islice(pattern.finditer(text), self.MAX_KEYWORD_CONTEXTS):
+            # Index of the word containing the match start
+            i = bisect_right(word_starts, match.start()) - 1
+            start = max(0, i - window)
+            end = min(len(words), i + window + 1)
+            context_words.update(words[start:end])
+        
+        return context_words
     
-    def _calculate_context_overlap(self, contexts1: List[str], contexts2: List[str]) -> float:
-        """Calculate how similar the contexts are"""
-        if not contexts1 or not contexts2:
+    def _calculate_context_overlap(self, words1: Set[str], words2: Set[str]) -> float:
+        """Calculate how similar the contexts are (Jaccard over their word sets)"""
+        if not words1 or not words2:
             return 0.0
         
-        # Get words from all contexts
-        words1 = set(' '.join(contexts1).split())
-        words2 = set(' '.join(contexts2).split())
-        
-        # Calculate Jaccard similarity
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
+        intersection = len(words1 & words2)
+        union = len(words1) + len(words2) - intersection
         
         return intersection / union if union > 0 else 0.0
     
@@ -460,27 +734,32 @@ class ATSScorer:
         Analyze skill coverage and depth
         
         Args:
-            resume_skills: Skills from resume
-            job_skills: Required skills from job
+            resume_skills: Lowercased skills from resume (as from extract_skills)
+            job_skills: Lowercased required skills from job (as from extract_skills)
             
         Returns:
             Skills depth analysis
         """
-        resume_set = set(skill.lower() for skill in resume_skills)
-        job_set = set(skill.lower() for skill in job_skills)
+        resume_set = frozenset(resume_skills)
+        job_set = frozenset(job_skills)
         
         # Exact matches
         exact_matches = resume_set.intersection(job_set)
         
-        # Partial matches (related skills)
+        # Partial matches (related skills). A job skill is related to some
+        # resume skill exactly when it belongs to a family any resume skill is in
+        resume_haystack = self._join_for_search(resume_set)
+        contains_resume_skill = self._substring_matcher(resume_set)
+        resume_families = set()
+        for resume_skill in resume_set:
+            resume_families.update(self._SKILL_FAMILY_IDS.get(resume_skill, ()))
         partial_matches = set()
         for job_skill in job_set:
             if job_skill not in exact_matches:
-                for resume_skill in resume_set:
-                    if (job_skill in resume_skill or resume_skill in job_skill or
-                        self._are_skills_related(job_skill, resume_skill)):
-                        partial_matches.add(job_skill)
-                        break
+                if (job_skill in resume_haystack
+                        or not resume_families.isdisjoint(self._SKILL_FAMILY_IDS.get(job_skill, ()))
+                        or contains_resume_skill(job_skill)):
+                    partial_matches.add(job_skill)
         
         # Missing critical skills
         missing_skills = job_set - exact_matches - partial_matches
@@ -505,21 +784,9 @@ class ATSScorer:
     
     def _are_skills_related(self, skill1: str, skill2: str) -> bool:
         """Check if two skills are related"""
-        # Define skill relationships
-        skill_families = [
-            {'python', 'django', 'flask', 'fastapi', 'pandas', 'numpy'},
-            {'javascript', 'typescript', 'react', 'angular', 'vue', 'node.js', 'nodejs'},
-            {'aws', 'azure', 'gcp', 'cloud', 'lambda', 'ec2', 's3'},
-            {'docker', 'kubernetes', 'k8s', 'containers', 'devops'},
-            {'sql', 'mysql', 'postgresql', 'database', 'nosql', 'mongodb'},
-            {'machine learning', 'deep learning', 'ai', 'tensorflow', 'pytorch', 'data science'},
-        ]
-        
-        for family in skill_families:
-            if skill1 in family and skill2 in family:
-                return True
-        
-        return False
+        return not self._SKILL_FAMILY_IDS.get(skill1, frozenset()).isdisjoint(
+            self._SKILL_FAMILY_IDS.get(skill2, ())
+        )
     
     def generate_suggestions(
         self, 
@@ -636,6 +903,8 @@ class ATSScorer:
         Perform comprehensive multi-dimensional ATS analysis
         Uses advanced NLP, semantic similarity, and contextual understanding
         
+        Only the first MAX_ANALYSIS_CHARS characters of each text are analyzed.
+        
         Args:
             resume_text: Cleaned resume text
             job_description: Job description text
@@ -645,14 +914,36 @@ class ATSScorer:
         """
         print("\n🔍 Starting advanced ATS analysis...")
         
+        # Bound the work per request; the reported lengths stay the originals
+        resume_length = len(resume_text)
+        job_description_length = len(job_description)
+        resume_text = resume_text[:self.MAX_ANALYSIS_CHARS]
+        job_description = job_description[:self.MAX_ANALYSIS_CHARS]
+        
         # Normalize texts
         resume_normalized = self.normalize_text(resume_text)
         job_normalized = self.normalize_text(job_description)
         
+        # Load the spaCy and embedding models here, once, before the stages
+        # fan out and would otherwise all wait on the same load (the hashing
+        # vectorizer is cheap, and its stage falls back to 0 if unavailable)
+        self._ensure_nlp_loaded()
+        self._ensure_embeddings_loaded()
+        
+        # The embedding, TF-IDF and spaCy passes below are independent and spend
+        # most of their time in native code that releases the GIL, so they run
+        # concurrently; the remaining steps are cheap and combine their results
+        executor = _stage_executor()
+        semantic_future = executor.submit(self.calculate_semantic_similarity, resume_normalized, job_normalized)
+        tfidf_future = executor.submit(self.calculate_tfidf_similarity, resume_normalized, job_normalized)
+        job_keywords_future = executor.submit(self.extract_keywords, job_normalized, 100)
+        job_skills_future = executor.submit(self.extract_skills, job_description)
+        resume_skills_future = executor.submit(self.extract_skills, resume_text)
+        
         # 1. Keyword Analysis
         print("📊 Extracting and analyzing keywords...")
         resume_keywords = self.extract_keywords(resume_normalized, top_n=100)
-        job_keywords = self.extract_keywords(job_normalized, top_n=100)
+        job_keywords = job_keywords_future.result()
         
         matched_keywords, missing_keywords, keyword_match_rate = self.find_keyword_matches(
             resume_keywords, 
@@ -661,19 +952,19 @@ class ATSScorer:
         
         # 2. Semantic Similarity Analysis
         print("🧠 Computing semantic similarity...")
-        semantic_score = self.calculate_semantic_similarity(resume_normalized, job_normalized)
+        semantic_score = semantic_future.result()
         
         # 3. TF-IDF Analysis (as backup/complement)
         print("📈 Calculating TF-IDF similarity...")
-        tfidf_score = self.calculate_tfidf_similarity(resume_normalized, job_normalized)
+        tfidf_score = tfidf_future.result()
         
         # Use semantic if available, otherwise TF-IDF
         content_similarity = semantic_score if semantic_score > 0 else tfidf_score
         
         # 4. Skills Analysis
         print("🔧 Analyzing skills coverage...")
-        resume_skills = self.extract_skills(resume_text)
-        job_skills = self.extract_skills(job_description)
+        resume_skills = resume_skills_future.result()
+        job_skills = job_skills_future.result()
         skills_analysis = self.analyze_skills_depth(resume_skills, job_skills)
         
         # 5. Experience Depth Analysis
@@ -683,28 +974,20 @@ class ATSScorer:
         # 6. Context Analysis
         print("🎯 Analyzing keyword context...")
         context_analysis = self.analyze_keyword_context(
-            resume_text, 
-            job_description, 
+            resume_normalized, 
+            job_normalized, 
             job_keywords
         )
         
         # 7. Section Detection
         print("📋 Detecting resume sections...")
-        section_analysis = self.detect_sections(resume_text)
+        section_analysis = self.detect_sections(resume_normalized)
         section_completeness = sum(section_analysis.values()) / len(section_analysis)
         
         # 8. Calculate Multi-Dimensional ATS Score
         print("🎯 Computing final ATS score...")
         
-        # Weighted scoring components:
-        weights = {
-            'keyword_match': 0.25,      # 25% - Direct keyword matching
-            'content_similarity': 0.25,  # 25% - Semantic/TF-IDF similarity
-            'skills_coverage': 0.20,     # 20% - Skills match
-            'experience_quality': 0.15,  # 15% - Experience depth
-            'context_alignment': 0.10,   # 10% - Contextual usage
-            'section_structure': 0.05    # 5%  - Resume structure
-        }
+        weights = self.SCORE_WEIGHTS
         
         # Normalize all scores to 0-1 range
         normalized_scores = {
@@ -716,11 +999,15 @@ class ATSScorer:
             'section_structure': section_completeness
         }
         
-        # Calculate weighted average
-        ats_score = sum(
-            normalized_scores[component] * weight 
+        # Weighted contribution of each component, shared by the score and
+        # the breakdown below
+        contributions = {
+            component: normalized_scores[component] * weight
             for component, weight in weights.items()
-        ) * 100
+        }
+        
+        # Calculate weighted average
+        ats_score = sum(contributions.values()) * 100
         
         # Apply bonuses and penalties
         # Bonus for quantifiable achievements
@@ -734,7 +1021,7 @@ class ATSScorer:
             ats_score += 2
         
         # Penalty for very short resume (likely incomplete)
-        if len(resume_text) < 500:
+        if resume_length < 500:
             ats_score -= 10
         
         # Penalty for missing critical sections
@@ -810,7 +1097,7 @@ class ATSScorer:
                 component: {
                     'weight_percent': int(weight * 100),
                     'score': round(normalized_scores[component] * 100, 2),
-                    'contribution': round(normalized_scores[component] * weight * 100, 2)
+                    'contribution': round(contributions[component] * 100, 2)
                 }
                 for component, weight in weights.items()
             },
@@ -820,6 +1107,6 @@ class ATSScorer:
             
             # Metadata
             'analysis_timestamp': datetime.now().isoformat(),
-            'resume_length': len(resume_text),
-            'job_description_length': len(job_description)
+            'resume_length': resume_length,
+            'job_description_length': job_description_length
         }
@@ -0,0 +1,74 @@
+"""Embedding Batcher - coalesces concurrent sentence-transformer encode calls"""
+import queue
+import threading
+from concurrent.futures import Future
+from typing import List
+
+
+class EmbeddingBatcher:
+    """
+    Serve encode requests from many threads with shared model batches
+
+    Requests are queued and a single worker thread encodes them. Whatever has
+    queued up while the model was busy is drained and encoded together in one
+    call, so concurrent analyses share forward passes (sentence-transformers
+    sorts each batch by length, keeping padding low) while a lone request is
+    encoded immediately, with no added wait.
+    """
+
+    def __init__(self, model, max_batch_size: int = 32):
+        """
+        Args:
+            model: Loaded SentenceTransformer
+            max_batch_size: Most texts encoded in one model call
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._worker.start()
+
+    def encode(self, texts: List[str]) -> List:
+        """
+        Encode texts to unit-normalized embeddings, blocking until done
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding vector per input text
+        """
+        future = Future()
+        self._queue.put((texts, future))
+        return future.result()
+
+    def _run(self):
+        """Worker loop: drain pending requests and encode them as one batch"""
+        while True:
+            batch = [self._queue.get()]
+            count = len(batch[0][0])
+            while count < self.max_batch_size:
+                try:
+                    request = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(request)
+                count += len(request[0])
+
+            try:
+                embeddings = self.model.encode(
+                    [text for texts, _ in batch for text in texts],
+                    batch_size=self.max_batch_size,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                )
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for texts, future in batch:
+                future.set_result(list(embeddings[offset:offset + len(texts)]))
+                offset += len(texts)
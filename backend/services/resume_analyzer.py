@@ -1,26 +1,65 @@
 """Resume Analysis Service"""
-import io
-from typing import Union, Dict
-from parsers import PDFParser, DOCXParser, TextParser
-from .ats_scorer import ATSScorer
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from functools import cached_property
+from typing import BinaryIO, Union, Dict
+
+from .utils import content_hash
 
 
 class ResumeAnalyzer:
     """Main service for analyzing resumes"""
     
+    # Number of (resume, job description) analysis results kept in the LRU cache
+    ANALYSIS_CACHE_SIZE = 256
+    
     def __init__(self):
         """Initialize the analyzer"""
-        self.pdf_parser = PDFParser()
-        self.docx_parser = DOCXParser()
-        self.text_parser = TextParser()
-        self.ats_scorer = ATSScorer()
+        self._analysis_cache = OrderedDict()  # LRU of (resume, JD) digests -> result
+        self._analysis_cache_lock = threading.Lock()
+    
+    # The scorer and parsers are created on first use so their libraries are
+    # only imported when they are needed (or during warmup)
+    @cached_property
+    def ats_scorer(self):
+        from .ats_scorer import ATSScorer
+        return ATSScorer()
+    
+    @cached_property
+    def pdf_parser(self):
+        from parsers import PDFParser
+        return PDFParser()
+    
+    @cached_property
+    def docx_parser(self):
+        from parsers import DOCXParser
+        return DOCXParser()
     
-    def parse_resume(self, file_content: Union[bytes, str], file_type: str) -> str:
+    @cached_property
+    def text_parser(self):
+        from parsers import TextParser
+        return TextParser()
+    
+    def warmup(self):
+        """Load the parsers and NLP models up front so the first request doesn't pay for it"""
+        self.pdf_parser
+        self.docx_parser
+        self.text_parser
+        self.ats_scorer.warmup()
+    
+    def parse_resume(
+        self,
+        file_content: Union[bytes, str, os.PathLike, BinaryIO],
+        file_type: str
+    ) -> str:
         """
         Parse resume from different file formats
         
         Args:
-            file_content: File content as bytes or string
+            file_content: File content as bytes or string, a filesystem path
+                (PDF/DOCX only), or an open binary file object
             file_type: File type ('pdf', 'docx', 'text')
             
         Returns:
@@ -37,8 +76,10 @@ class ResumeAnalyzer:
             return self.docx_parser.clean_text(text)
         
         elif file_type in ['txt', 'text']:
-            if isinstance(file_content, bytes):
-                file_content = file_content.decode('utf-8')
+            if hasattr(file_content, 'read'):
+                file_content = file_content.read()
+            if isinstance(file_content, (bytes, bytearray, memoryview)):
+                file_content = str(file_content, 'utf-8')
             text = self.text_parser.extract_text(file_content)
             return self.text_parser.clean_text(text)
         
@@ -66,4 +107,23 @@ class ResumeAnalyzer:
         if not job_description or len(job_description.strip()) < 20:
             raise ValueError("Job description is too short or empty")
         
-        return self.ats_scorer.analyze(resume_text, job_description)
+        # Users typically rescore the same resume against several postings,
+        # or resubmit unchanged; identical pairs reuse the earlier result.
+        # Callers get shallow copies so the cached entry's top level is never altered
+        key = (content_hash(resume_text), content_hash(job_description))
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(key)
+        
+        if cached is not None:
+            result = dict(cached)
+            result['analysis_timestamp'] = datetime.now().isoformat()
+            return result
+        
+        result = self.ats_scorer.analyze(resume_text, job_description)
+        with self._analysis_cache_lock:
+            self._analysis_cache[key] = result
+            if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        return dict(result)
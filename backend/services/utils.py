@@ -0,0 +1,17 @@
+"""Shared helpers for the analysis services"""
+import hashlib
+
+
+def content_hash(text: str) -> bytes:
+    """
+    Stable 16-byte BLAKE2b digest of a text, for use as a cache key
+    
+    Unlike hash(), the digest is the same in every process.
+    
+    Args:
+        text: Text to identify
+        
+    Returns:
+        Digest bytes
+    """
+    return hashlib.blake2b(text.encode('utf-8', 'ignore'), digest_size=16).digest()
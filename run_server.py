@@ -1,16 +1,34 @@
 #!/usr/bin/env python3
-"""Wrapper to suppress numpy warnings and start the FastAPI server"""
+"""Start the FastAPI server
+
+Settings come from environment variables:
+  HOST             Interface to bind (default 0.0.0.0)
+  PORT             Port to listen on (default 8000)
+  WEB_CONCURRENCY  Worker processes (default 1); each loads its own models
+  LOG_LEVEL        Uvicorn log level (default info)
+"""
 import warnings
 import os
 
 # Suppress numpy warnings
 warnings.filterwarnings('ignore', category=RuntimeWarning)
-warnings.filterwarnings('ignore', message='.*Numpy built with MINGW-W64.*')
+warnings.filterwarnings('ignore', message='.*Numpy.*')
 
 # Start the server
 if __name__ == "__main__":
     import uvicorn
-    from backend.main import app
-    
-    print("Starting FastAPI server on http://0.0.0.0:8000")
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+
+    host = os.environ.get("HOST", "0.0.0.0")
+    port = int(os.environ.get("PORT", "8000"))
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+
+    print(f"Starting FastAPI server on http://{host}:{port} ({workers} worker(s))", flush=True)
+    # Passed as an import string so uvicorn can spawn several workers; the
+    # event loop and HTTP parser default to uvloop/httptools when installed
+    uvicorn.run(
+        "backend.main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        log_level=os.environ.get("LOG_LEVEL", "info"),
+    )
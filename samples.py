@@ -0,0 +1,29 @@
+"""Cached loader for the files in sample_resumes/
+
+Each sample is read from disk once per process; later loads return the same
+string from memory.
+"""
+import os
+from functools import lru_cache
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_resumes")
+
+
+@lru_cache(maxsize=None)
+def names(*extensions: str) -> tuple:
+    """Sorted names of the sample files ending in any of `extensions`"""
+    return tuple(sorted(name for name in os.listdir(SAMPLES_DIR) if name.endswith(extensions)))
+
+
+@lru_cache(maxsize=None)
+def load(name: str) -> str:
+    """Return the text of sample_resumes/<name>"""
+    with open(os.path.join(SAMPLES_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def load_bytes(name: str) -> bytes:
+    """Return the raw bytes of sample_resumes/<name>, e.g. a PDF"""
+    with open(os.path.join(SAMPLES_DIR, name), "rb") as f:
+        return f.read()
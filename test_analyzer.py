@@ -2,15 +2,14 @@
 """Test script for Resume ATS Analyzer"""
 
 from backend.services.resume_analyzer import ResumeAnalyzer
+from samples import load
 
 # Test with sample files
 try:
     print("Loading sample files...")
-    with open('sample_resumes/sample_resume.txt', 'r') as f:
-        resume_text = f.read()
+    resume_text = load("sample_resume.txt")
 
-    with open('sample_resumes/sample_job_description.txt', 'r') as f:
-        job_desc = f.read()
+    job_desc = load("sample_job_description.txt")
 
     print("Creating analyzer...")
     analyzer = ResumeAnalyzer()
@@ -3,12 +3,12 @@
 import warnings
 warnings.filterwarnings('ignore')
 
+from samples import load
+
 print("Loading sample files...", flush=True)
-with open("sample_resumes/sample_resume.txt", "r") as f:
-    resume_text = f.read()
+resume_text = load("sample_resume.txt")
 
-with open("sample_resumes/sample_job_description.txt", "r") as f:
-    job_description = f.read()
+job_description = load("sample_job_description.txt")
 
 print(f"Resume: {len(resume_text)} chars", flush=True)
 print(f"Job Description: {len(job_description)} chars", flush=True)
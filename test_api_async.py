@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Analyze every sample resume concurrently against the API
+
+Requests are sent together over one aiohttp connection pool, so the run takes
+about as long as the slowest analysis instead of the sum of all of them.
+tests/test_api.py remains the quick smoke test.
+
+Usage:
+1. Start backend in one terminal: python run_server.py
+2. Run this script in another terminal: python test_api_async.py [copies]
+   (copies repeats each sample to put more requests in flight; default 1)
+
+Requires aiohttp (pip install aiohttp).
+"""
+import asyncio
+import json
+import sys
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from samples import load, load_bytes, names
+
+URL = "http://127.0.0.1:8000/api/analyze"
+RESUME_EXTENSIONS = ('.txt', '.pdf', '.docx')
+# orjson decodes the analysis responses several times faster when installed
+JSON_LOADS = orjson.loads if orjson is not None else json.loads
+
+
+def build_payloads(copies=1):
+    """Build (label, file name, content) for each sample resume, repeated `copies` times"""
+    payloads = []
+    for name in names(*RESUME_EXTENSIONS):
+        if "job_description" in name:
+            continue
+        content = load_bytes(name)
+        for copy in range(copies):
+            payloads.append((f"{name}#{copy + 1}", name, content))
+    return payloads
+
+
+def form_data(job_description, name, content):
+    """Multipart form for one analyze request; aiohttp forms are single-use"""
+    data = aiohttp.FormData()
+    data.add_field("job_description", job_description)
+    if name.endswith(".txt"):
+        data.add_field("resume_text", content.decode("utf-8", errors="ignore"))
+    else:
+        data.add_field("resume_file", content, filename=name)
+    return data
+
+
+async def analyze(session, job_description, label, name, content):
+    """POST one analyze request and return (label, status, body or error, seconds)"""
+    start = time.perf_counter()
+    try:
+        async with session.post(URL, data=form_data(job_description, name, content)) as response:
+            body = await response.json(loads=JSON_LOADS, content_type=None)
+            return label, response.status, body, time.perf_counter() - start
+    except aiohttp.ClientError as e:
+        return label, None, str(e), time.perf_counter() - start
+
+
+async def run(copies=1):
+    job_description = load("sample_job_description.txt")
+
+    payloads = build_payloads(copies)
+    print(f"Sending {len(payloads)} analyze requests concurrently...")
+
+    start = time.perf_counter()
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=30),
+        timeout=aiohttp.ClientTimeout(total=120, sock_connect=2.0)
+    ) as session:
+        results = await asyncio.gather(*[
+            analyze(session, job_description, *payload) for payload in payloads
+        ])
+    elapsed = time.perf_counter() - start
+
+    failures = 0
+    lines = []
+    for label, status, body, seconds in results:
+        if status == 200:
+            lines.append(f"  [OK]   {label}: ATS Score {body.get('ats_score', 'N/A')} ({seconds:.2f}s)")
+        else:
+            failures += 1
+            lines.append(f"  [FAIL] {label}: {status} {body}")
+
+    lines.append(f"\n{len(results) - failures}/{len(results)} succeeded in {elapsed:.2f}s total")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    return failures == 0
+
+
+if __name__ == "__main__":
+    if aiohttp is None:
+        print("aiohttp is not installed. Run: pip install aiohttp")
+        sys.exit(1)
+
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    sys.exit(0 if asyncio.run(run(copies)) else 1)
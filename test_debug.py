@@ -4,12 +4,11 @@ import warnings
 warnings.filterwarnings('ignore')
 
 from backend.services.resume_analyzer import ResumeAnalyzer
+from samples import load
 
-with open("sample_resumes/sample_resume.txt", "r") as f:
-    resume_text = f.read()
+resume_text = load("sample_resume.txt")
 
-with open("sample_resumes/sample_job_description.txt", "r") as f:
-    job_description = f.read()
+job_description = load("sample_job_description.txt")
 
 analyzer = ResumeAnalyzer()
 result = analyzer.analyze_resume(resume_text, job_description)
@@ -1,22 +1,52 @@
 #!/usr/bin/env python3
+"""Import the scorer's dependencies one step at a time, timing each
+
+Each step's imports live inside its function, so only the steps that run pay
+for them. The backend modules themselves defer numpy, scikit-learn, spaCy and
+sentence-transformers until first use, which is why the ATSScorer step is fast
+on its own.
+
+Usage: python test_imports_detailed.py [step ...]   (default: all steps)
+"""
+import sys
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
-print("Step 1: Testing imports step by step...", flush=True)
-
-print("1.1: import re", flush=True)
-import re
-print("1.2: import typing", flush=True)
-from typing import List, Dict, Tuple, Set
-print("1.3: import collections", flush=True)
-from collections import Counter
-print("1.4: import sklearn TfidfVectorizer", flush=True)
-from sklearn.feature_extraction.text import TfidfVectorizer
-print("1.5: import sklearn cosine_similarity", flush=True)
-from sklearn.metrics.pairwise import cosine_similarity
-print("1.6: import numpy", flush=True)
-import numpy as np
-
-print("\nStep 2: Attempting to import ATSScorer...", flush=True)
-from backend.services.ats_scorer import ATSScorer
-print("SUCCESS - ATSScorer imported", flush=True)
+
+def import_stdlib():
+    import re
+    from typing import List, Dict, Tuple, Set
+    from collections import Counter
+
+
+def import_sklearn():
+    from sklearn.feature_extraction.text import HashingVectorizer
+    from sklearn.preprocessing import normalize
+
+
+def import_numpy():
+    import numpy as np
+
+
+def import_scorer():
+    from backend.services.ats_scorer import ATSScorer
+
+
+STEPS = {
+    'stdlib': import_stdlib,
+    'sklearn': import_sklearn,
+    'numpy': import_numpy,
+    'scorer': import_scorer,
+}
+
+
+if __name__ == "__main__":
+    selected = sys.argv[1:] or list(STEPS)
+    for i, name in enumerate(selected, 1):
+        print(f"{i}: import {name}...", end=" ", flush=True)
+        start = time.perf_counter()
+        STEPS[name]()
+        print(f"OK ({time.perf_counter() - start:.2f}s)", flush=True)
+
+    print("SUCCESS - imports completed", flush=True)
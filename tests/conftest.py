@@ -0,0 +1,30 @@
+"""Shared fixtures for the API tests
+
+These tests talk to a running server (python run_server.py) and are skipped
+when none answers.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _http import SESSION, wait_ready  # noqa: E402
+
+BASE_URL = os.environ.get("API_BASE_URL", "http://127.0.0.1:8000")
+
+
+@pytest.fixture(scope="session")
+def session():
+    """The pooled keep-alive session, shared by every test"""
+    yield SESSION
+    SESSION.close()
+
+
+@pytest.fixture(scope="session")
+def server_ready(session):
+    """Base URL of the API, once it answers; skips the tests otherwise"""
+    if not wait_ready(f"{BASE_URL}/", deadline=5.0):
+        pytest.skip(f"API server not running at {BASE_URL}")
+    return BASE_URL
@@ -0,0 +1,136 @@
+"""End-to-end tests for the analyze endpoints against a running server
+
+Usage:
+1. Start backend in one terminal: python run_server.py
+2. Run the tests in another terminal: python -m pytest tests
+   (with pytest-xdist installed, add -n auto to run cases in parallel)
+"""
+import base64
+import os
+
+import pytest
+
+from _http import DEFAULT_TIMEOUT, parse, post_file
+from samples import SAMPLES_DIR, load, load_bytes, names
+
+SHORT_RESUME = "John Doe - Python Developer with 5 years experience"
+
+DETAILED_RESUME = """
+John Doe
+Senior Software Engineer
+
+SKILLS
+- Python (Django, FastAPI, Flask)
+- AWS (EC2, S3, RDS)
+- PostgreSQL, Redis
+- Docker, Kubernetes
+
+EXPERIENCE
+Senior Python Developer at TechCorp (2020-2024)
+- Built scalable APIs using Django and FastAPI
+- Managed AWS infrastructure
+- Optimized PostgreSQL queries
+
+Python Developer at StartupXYZ (2018-2020)
+- Full-stack Django development
+- Database optimization
+
+EDUCATION
+BS Computer Science - State University (2018)
+"""
+
+# endpoint, request kwargs, expected status
+CASES = [
+    pytest.param(
+        "/api/analyze",
+        {"data": {"job_description": load("sample_job_description.txt"),
+                  "resume_text": load("sample_resume.txt")}},
+        200,
+        id="sample-form",
+    ),
+    pytest.param(
+        "/api/analyze",
+        {"data": {"job_description": "Senior Developer Position", "resume_text": SHORT_RESUME}},
+        200,
+        id="minimal-form",
+    ),
+    pytest.param(
+        "/api/analyze",
+        {"data": {"job_description": "Senior Developer Position"}},
+        400,
+        id="missing-resume",
+    ),
+    pytest.param(
+        "/api/analyze-json",
+        {"json": {"job_description": "Senior Python Developer with 5+ years Django experience, "
+                                     "AWS expertise, and PostgreSQL knowledge",
+                  "resume_text": DETAILED_RESUME}},
+        200,
+        id="detailed-json",
+    ),
+]
+
+
+def assert_analysis(result):
+    """Check the fields every compact analysis response carries"""
+    assert 0 <= result["ats_score"] <= 100
+    assert 0 <= result["keyword_match_rate"] <= 100
+    assert isinstance(result["matched_keywords"], list)
+    assert isinstance(result["missing_keywords"], list)
+    assert isinstance(result["suggestions"], list)
+    assert set(result["section_analysis"]) == {"skills", "experience", "education"}
+
+
+def test_root(session, server_ready):
+    response = session.get(f"{server_ready}/", timeout=DEFAULT_TIMEOUT)
+    assert response.status_code == 200
+    assert "/api/analyze" in parse(response)["endpoints"].values()
+
+
+@pytest.mark.parametrize("endpoint, request_kwargs, expected_status", CASES)
+def test_analyze(session, server_ready, endpoint, request_kwargs, expected_status):
+    response = session.post(f"{server_ready}{endpoint}", timeout=DEFAULT_TIMEOUT, **request_kwargs)
+    assert response.status_code == expected_status, response.text
+    if expected_status == 200:
+        assert_analysis(parse(response))
+
+
+@pytest.mark.parametrize("name", names(".pdf", ".docx"))
+def test_analyze_upload(server_ready, name):
+    response = post_file(
+        f"{server_ready}/api/analyze",
+        {"job_description": load("sample_job_description.txt")},
+        "resume_file",
+        os.path.join(SAMPLES_DIR, name),
+        timeout=DEFAULT_TIMEOUT,
+    )
+    assert response.status_code == 200, response.text
+    assert_analysis(parse(response))
+
+
+def test_analyze_batch(session, server_ready):
+    job_description = load("sample_job_description.txt")
+    items = [
+        {"job_description": job_description, "resume_text": load("sample_resume.txt")},
+        {"job_description": job_description, "resume_text": "too short"},
+    ]
+    for name in names(".pdf", ".docx"):
+        items.append({
+            "job_description": job_description,
+            "resume_file": base64.b64encode(load_bytes(name)).decode("ascii"),
+            "filename": name,
+        })
+
+    response = session.post(
+        f"{server_ready}/api/analyze_batch",
+        json={"items": items},
+        timeout=(DEFAULT_TIMEOUT[0], DEFAULT_TIMEOUT[1] * len(items)),
+    )
+    assert response.status_code == 200, response.text
+
+    results = parse(response)["results"]
+    assert len(results) == len(items)
+    assert_analysis(results[0]["analysis"])
+    assert results[1]["analysis"] is None and results[1]["error"]
+    for result in results[2:]:
+        assert_analysis(result["analysis"])
@@ -0,0 +1,86 @@
+"""In-process tests of the FastAPI app with a stubbed analyzer
+
+Unlike test_api.py these need no running server: requests go through
+FastAPI's TestClient, and the analyzer is replaced so no models load.
+"""
+import pytest
+
+pytest.importorskip("httpx")  # Required by TestClient (httpx < 0.28 for the pinned Starlette)
+
+from fastapi.testclient import TestClient
+
+from backend import main  # Puts backend/ on sys.path for the imports below
+import api.routes as routes
+
+JOB_DESCRIPTION = "Senior Python Developer with Django and AWS experience"
+RESUME_TEXT = "John Doe - Python Developer with 5 years of Django and AWS experience"
+
+
+class StubAnalyzer:
+    """Stands in for ResumeAnalyzer and records what it was asked to analyze"""
+
+    def __init__(self):
+        self.calls = []
+
+    def warmup(self):
+        pass
+
+    def analyze_resume(self, resume_text, job_description):
+        self.calls.append((resume_text, job_description))
+        return {
+            "ats_score": 80,
+            "matched_keywords": ["python"],
+            "missing_keywords": ["kubernetes"],
+            "section_analysis": {"skills": True, "experience": True, "education": False},
+            "suggestions": ["Add kubernetes"],
+            "keyword_match_rate": 50.0,
+            "skill_gaps": ["kubernetes"],
+            # Only returned to verbose requests
+            "score_breakdown": {"keyword_match": 0.5},
+        }
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    stub = StubAnalyzer()
+    monkeypatch.setattr(routes, "_analyzer", stub)
+    return stub
+
+
+@pytest.fixture
+def client(analyzer):
+    return TestClient(main.app)
+
+
+def test_oversized_content_length_rejected(client, analyzer):
+    body = b"x" * (main.MAX_REQUEST_BYTES + 1)
+    response = client.post(
+        "/api/analyze",
+        content=body,
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request body is too large"}
+    assert analyzer.calls == []
+
+
+def test_request_within_limit_reaches_analyzer(client, analyzer):
+    response = client.post("/api/analyze", data={"job_description": JOB_DESCRIPTION, "resume_text": RESUME_TEXT})
+    assert response.status_code == 200
+    assert analyzer.calls == [(RESUME_TEXT, JOB_DESCRIPTION)]
+
+
+@pytest.mark.parametrize("endpoint, request_kwargs", [
+    ("/api/analyze", {"data": {"job_description": JOB_DESCRIPTION, "resume_text": RESUME_TEXT}}),
+    ("/api/analyze-json", {"json": {"job_description": JOB_DESCRIPTION, "resume_text": RESUME_TEXT}}),
+])
+def test_verbose_flag(client, endpoint, request_kwargs):
+    compact = client.post(endpoint, **request_kwargs)
+    assert compact.status_code == 200
+    assert "score_breakdown" not in compact.json()
+    assert compact.json()["ats_score"] == 80
+
+    verbose = client.post(endpoint, params={"verbose": "true"}, **request_kwargs)
+    assert verbose.status_code == 200
+    assert verbose.headers["content-type"] == "application/json"
+    assert verbose.json() == StubAnalyzer().analyze_resume(RESUME_TEXT, JOB_DESCRIPTION)
@@ -6,6 +6,8 @@ Runs server and performs analysis without network calls
 import sys
 import time
 
+from samples import load
+
 print("=" * 80)
 print("AI Resume ATS Checker - Complete Verification")
 print("=" * 80)
@@ -22,10 +24,8 @@ except Exception as e:
 # Test 2: Load sample files
 print("[2/3] Loading sample files...", end=" ", flush=True)
 try:
-    with open("sample_resumes/sample_resume.txt", "r") as f:
-        resume_text = f.read()
-    with open("sample_resumes/sample_job_description.txt", "r") as f:
-        job_description = f.read()
+    resume_text = load("sample_resume.txt")
+    job_description = load("sample_job_description.txt")
     print("OK")
 except Exception as e:
     print(f"FAILED: {e}")
@@ -43,29 +43,33 @@ except Exception as e:
     traceback.print_exc()
     sys.exit(1)
 
-# Display results
-print("\n" + "=" * 80)
-print("ANALYSIS RESULTS")
-print("=" * 80)
-print(f"ATS Score:              {result['ats_score']}/100")
-print(f"Keyword Match Rate:     {result['keyword_match_rate']:.1f}%")
-print(f"Matched Keywords:       {len(result['matched_keywords'])} found")
-print(f"  Examples:             {', '.join(result['matched_keywords'][:5])}")
-print(f"Missing Keywords:       {len(result['missing_keywords'])} identified")
-print(f"  Examples:             {', '.join(result['missing_keywords'][:5])}")
-print(f"\nResume Sections:")
-print(f"  Skills Present:       {result['section_analysis']['skills']}")
-print(f"  Experience Present:   {result['section_analysis']['experience']}")
-print(f"  Education Present:    {result['section_analysis']['education']}")
-print(f"\nSuggestions ({len(result['suggestions'])}):")
-for i, suggestion in enumerate(result['suggestions'][:3], 1):
-    print(f"  {i}. {suggestion}")
-
-print("\n" + "=" * 80)
-print("VERIFICATION COMPLETE - ALL SYSTEMS OPERATIONAL")
-print("=" * 80)
-print("\nTo start the API server:")
-print("  python start_server.py")
-print("\nTo access the API documentation:")
-print("  http://127.0.0.1:8000/docs")
-print("=" * 80)
+# Display results, written out in one go
+lines = [
+    "\n" + "=" * 80,
+    "ANALYSIS RESULTS",
+    "=" * 80,
+    f"ATS Score:              {result['ats_score']}/100",
+    f"Keyword Match Rate:     {result['keyword_match_rate']:.1f}%",
+    f"Matched Keywords:       {len(result['matched_keywords'])} found",
+    f"  Examples:             {', '.join(result['matched_keywords'][:5])}",
+    f"Missing Keywords:       {len(result['missing_keywords'])} identified",
+    f"  Examples:             {', '.join(result['missing_keywords'][:5])}",
+    f"\nResume Sections:",
+    f"  Skills Present:       {result['section_analysis']['skills']}",
+    f"  Experience Present:   {result['section_analysis']['experience']}",
+    f"  Education Present:    {result['section_analysis']['education']}",
+    f"\nSuggestions ({len(result['suggestions'])}):",
+]
+lines.extend(f"  {i}. {suggestion}" for i, suggestion in enumerate(result['suggestions'][:3], 1))
+lines += [
+    "\n" + "=" * 80,
+    "VERIFICATION COMPLETE - ALL SYSTEMS OPERATIONAL",
+    "=" * 80,
+    "\nTo start the API server:",
+    "  python run_server.py",
+    "\nTo access the API documentation:",
+    "  http://127.0.0.1:8000/docs",
+    "=" * 80,
+]
+sys.stdout.write("\n".join(lines) + "\n")
+sys.stdout.flush()